@@ -5,8 +5,15 @@ This package provides integration between CopilotKit and CrewAI flows,
 allowing for seamless tool usage in chat interactions.
 """
 
-from agentic_chat.main import AgenticChatFlow
-
 __all__ = [
     'AgenticChatFlow',
 ]
+
+
+def __getattr__(name):
+    # Load the flow lazily so that importing the package does not pull in
+    # crewai and litellm until the flow is actually used.
+    if name == 'AgenticChatFlow':
+        from agentic_chat.main import AgenticChatFlow
+        return AgenticChatFlow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,29 +3,33 @@ A simple agentic chat flow.
 """
 
 from crewai.flow.flow import Flow, start
-from litellm import completion
+from litellm import acompletion
 from ag_ui_crewai import copilotkit_stream, CopilotKitState
 
 import sys
 
+# Kept static so the prompt prefix is identical across turns and can be
+# served from the provider's prompt cache. Per-turn context should be sent
+# as a separate message rather than spliced into this string.
+SYSTEM_PROMPT = "You are a helpful assistant."
+
 class AgenticChatFlow(Flow[CopilotKitState]):
 
     @start()
     async def chat(self):
-        system_prompt = "You are a helpful assistant."
-
         # 1. Run the model and stream the response
         #    Note: In order to stream the response, wrap the completion call in
-        #    copilotkit_stream and set stream=True.
+        #    copilotkit_stream and set stream=True. acompletion is used so that
+        #    reading the stream does not block the event loop.
         response = await copilotkit_stream(
-            completion(
+            await acompletion(
 
                 # 1.1 Specify the model to use
                 model="openai/gpt-4o",
                 messages=[
                     {
                         "role": "system",
-                        "content": system_prompt
+                        "content": SYSTEM_PROMPT
                     },
                     *self.state.messages
                 ],